@@ -0,0 +1,45 @@
+"""Shared Depth-Anything-V2 model construction for the converters.
+
+Both exporters previously carried their own MODEL_CONFIGS copy and
+checkpoint-loading boilerplate; this module is the single source for
+variant configs and a cached loader, so a session that runs the ONNX
+and TFLite converters back to back builds each variant exactly once.
+"""
+
+import os
+from functools import lru_cache
+
+from _repo_utils import ensure_repo, load_state_dict
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+CHECKPOINT_DIR = os.path.join(SCRIPT_DIR, 'checkpoints')
+
+MODEL_CONFIGS = {
+    'vits': {'encoder': 'vits', 'features': 64,
+             'out_channels': [48, 96, 192, 384]},
+    'vitb': {'encoder': 'vitb', 'features': 128,
+             'out_channels': [96, 192, 384, 768]},
+    'vitl': {'encoder': 'vitl', 'features': 256,
+             'out_channels': [256, 512, 1024, 1024]},
+}
+
+
+def checkpoint_path(variant):
+    return os.path.join(CHECKPOINT_DIR, f'depth_anything_v2_{variant}.pth')
+
+
+@lru_cache(maxsize=None)
+def get_model(variant):
+    """Fetch sources, build the variant and load its checkpoint (cached).
+
+    Callers are expected to have verified the checkpoint exists; the
+    cache hands every caller in the process the same eval-mode module.
+    """
+    ensure_repo()
+
+    from depth_anything_v2.dpt import DepthAnythingV2
+
+    model = DepthAnythingV2(**MODEL_CONFIGS[variant])
+    model.load_state_dict(load_state_dict(checkpoint_path(variant)))
+    model.eval()
+    return model
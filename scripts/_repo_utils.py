@@ -0,0 +1,130 @@
+"""Shared helpers for fetching the Depth-Anything-V2 sources.
+
+Both conversion scripts need the upstream repo on sys.path to import
+depth_anything_v2.dpt. Cache the clone behind a module-level sentinel so
+repeated runs — and running both scripts in one session — skip the git
+subprocess and the duplicate sys.path entry entirely.
+"""
+
+import http.client
+import os
+import shutil
+import subprocess
+import sys
+import tarfile
+import urllib.request
+from functools import lru_cache
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.join(SCRIPT_DIR, 'Depth-Anything-V2')
+REPO_URL = 'https://github.com/DepthAnything/Depth-Anything-V2'
+ARCHIVE_URL = REPO_URL + '/archive/refs/heads/main.tar.gz'
+
+_repo_ready = False
+
+
+def _fetch_archive(subpath):
+    """Stream the GitHub tarball and extract only `subpath` into REPO_DIR.
+
+    One plain HTTPS request instead of a git subprocess: no protocol
+    negotiation, no pack index, no .git object database on disk. The
+    stream-mode tarfile decompresses on the fly, so the archive is never
+    held in memory either. Extraction goes through a sibling temp dir
+    that is renamed into place only on success, so an interrupted fetch
+    never leaves a half-populated REPO_DIR for later runs to trust.
+    """
+    print(f'Fetching {ARCHIVE_URL} ({subpath} only)...')
+    tmp_dir = REPO_DIR + '.partial'
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    try:
+        with urllib.request.urlopen(ARCHIVE_URL) as resp:
+            with tarfile.open(fileobj=resp, mode='r|gz') as tar:
+                for member in tar:
+                    # Members are prefixed 'Depth-Anything-V2-main/...'.
+                    parts = member.name.split('/', 1)
+                    if len(parts) == 2 \
+                            and parts[1].startswith(subpath + '/'):
+                        member.name = parts[1]
+                        tar.extract(member, tmp_dir, filter='data')
+        os.rename(tmp_dir, REPO_DIR)
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+
+@lru_cache(maxsize=4)
+def dummy_input(size):
+    """Deterministic tracing/validation tensor shared by the exporters.
+
+    A fixed-seed Generator keeps exports bit-reproducible across runs
+    (no run-specific constants baked into the graph) while still giving
+    the validation pass non-trivial values, and lru_cache means the
+    export trace and the numpy inference check share one allocation —
+    .numpy() on a contiguous CPU tensor is zero-copy.
+    """
+    import torch
+    g = torch.Generator().manual_seed(0)
+    return torch.randn(1, 3, size, size, generator=g)
+
+
+def load_state_dict(pth_file):
+    """Load a checkpoint, caching it as safetensors for later runs.
+
+    torch.load unpickles the whole file on every invocation. The one-time
+    safetensors conversion makes every subsequent load a zero-copy mmap
+    that the OS page cache shares across processes — noticeable when the
+    export scripts are re-run iteratively. The torch.load calls mmap the
+    zipfile storages too (torch >= 2.1), so even the first load avoids
+    staging the full checkpoint through read() buffers.
+    """
+    import torch
+    try:
+        from safetensors.torch import load_file, save_file
+    except ImportError:
+        return torch.load(
+            pth_file, map_location='cpu', weights_only=True, mmap=True)
+
+    st_file = os.path.splitext(pth_file)[0] + '.safetensors'
+    if not os.path.exists(st_file):
+        state_dict = torch.load(
+            pth_file, map_location='cpu', weights_only=True, mmap=True)
+        save_file(state_dict, st_file)
+        return state_dict
+    return load_file(st_file)
+
+
+def ensure_repo(subpath='depth_anything_v2'):
+    """Fetch the upstream sources once and put them on sys.path (idempotent).
+
+    Only the `subpath` package is needed for the import. The primary path
+    is a streamed tarball download of just those files; when that is not
+    reachable, a shallow blob-filtered sparse git clone does the same.
+    """
+    global _repo_ready
+    if _repo_ready:
+        return REPO_DIR
+    # Readiness is keyed on the package actually being present, not on
+    # the directory existing: a crashed clone from an earlier run must
+    # not be mistaken for a usable checkout.
+    if not os.path.exists(os.path.join(REPO_DIR, subpath)):
+        shutil.rmtree(REPO_DIR, ignore_errors=True)
+        try:
+            _fetch_archive(subpath)
+        except (OSError, http.client.HTTPException,
+                tarfile.TarError) as exc:
+            # Proxies and offline mirrors sometimes block codeload, and
+            # a connection dropped mid-stream surfaces from the response
+            # read as IncompleteRead rather than OSError; the sparse
+            # blob-filtered clone stays as the fallback for all of them.
+            print(f'⚠️ Archive fetch failed ({exc}); falling back to git')
+            subprocess.run(
+                ['git', 'clone', '--depth', '1', '--filter=blob:none',
+                 '--sparse', REPO_URL, REPO_DIR], check=True)
+            subprocess.run(
+                ['git', '-C', REPO_DIR, 'sparse-checkout', 'set', subpath],
+                check=True)
+    if REPO_DIR not in sys.path:
+        sys.path.insert(0, REPO_DIR)
+    _repo_ready = True
+    return REPO_DIR
@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+"""Build the Project S.E.E. technical report as a .docx.
+
+The report content is declared once in CONTENT below — a flat sequence of
+(kind, payload) entries — and rendered in a single forward pass over that
+spec. Adding a section means adding entries to CONTENT, not writing new
+build code.
+
+Usage:
+    python scripts/build_docx.py [output.docx] [--no-cache]
+
+Requires:
+    pip install python-docx
+    pip install matplotlib   (optional, for the latency diagram)
+"""
+
+import hashlib
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from io import BytesIO
+from datetime import date
+from functools import lru_cache
+from xml.sax.saxutils import escape
+
+from docx import Document
+from docx.enum.style import WD_STYLE_TYPE
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+from docx.shared import Cm, Pt, RGBColor
+
+# Pt/Cm/RGBColor allocate a new EMU/color object on every call. The
+# report only ever uses a handful of distinct values, so memoize them
+# instead of reconstructing per run.
+_pt = lru_cache(maxsize=None)(Pt)
+_cm = lru_cache(maxsize=None)(Cm)
+_rgb = lru_cache(maxsize=None)(RGBColor)
+
+# Every code line carries the same shading; parse the element once and
+# deep-copy it per run instead of rebuilding the attribute dict each time.
+_SHD_TEMPLATE = parse_xml(
+    '<w:shd %s w:val="clear" w:fill="F1F5F9"/>' % nsdecls('w')
+)
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+IMG_DIR = os.path.join(SCRIPT_DIR, 'diagrams')
+CACHE_DIR = os.path.join(SCRIPT_DIR, '.cache')
+DEFAULT_OUTPUT = os.path.join(SCRIPT_DIR, 'report.docx')
+
+# Dynamic fields patched into the frozen template on every run.
+GENERATED_PLACEHOLDER = '{{GENERATED}}'
+
+# One pool shared by the whole build; diagram reads overlap the
+# CPU-bound XML construction happening on the main thread.
+_EXECUTOR = ThreadPoolExecutor(max_workers=4)
+
+# filename -> Future[BytesIO], populated by _prefetch_images() in build().
+_image_futures = {}
+
+# (paragraph, filename, width_cm) placeholders filled by _embed_images().
+_pending_images = []
+
+
+def _read_image(path):
+    with open(path, 'rb') as f:
+        return BytesIO(f.read())
+
+
+def _prefetch_images(entries):
+    """Kick off concurrent reads for every diagram referenced in the spec.
+
+    A single os.scandir replaces the per-insert join+exists stat pair,
+    and add_image later consumes an in-memory BytesIO, so add_picture
+    never touches the disk on the build path.
+    """
+    try:
+        available = {e.name: e.path for e in os.scandir(IMG_DIR) if e.is_file()}
+    except FileNotFoundError:
+        available = {}
+    _image_futures.clear()
+    for kind, payload in entries:
+        if kind == 'img' and payload[0] in available:
+            _image_futures[payload[0]] = _EXECUTOR.submit(
+                _read_image, available[payload[0]])
+
+
+# ---------------------------------------------------------------------------
+# Render helpers
+# ---------------------------------------------------------------------------
+
+def _define_styles(doc):
+    """Create the shared paragraph styles the render helpers assign.
+
+    Carrying font/size/color on named styles instead of every run keeps
+    the emitted XML small: each paragraph holds a single pStyle reference
+    rather than a full rPr block per run.
+    """
+    styles = doc.styles
+
+    for name in ('Heading 1', 'Heading 2'):
+        styles[name].font.name = 'Calibri'
+        styles[name].font.color.rgb = _rgb(0x1F, 0x3B, 0x73)
+
+    body = styles.add_style('SeeBody', WD_STYLE_TYPE.PARAGRAPH)
+    body.base_style = styles['Normal']
+    body.font.name = 'Calibri'
+    body.font.size = _pt(11)
+    body.font.color.rgb = _rgb(0x33, 0x33, 0x33)
+    body.paragraph_format.space_after = _pt(6)
+
+    bullet = styles.add_style('SeeBullet', WD_STYLE_TYPE.PARAGRAPH)
+    bullet.base_style = styles['List Bullet']
+    bullet.font.name = 'Calibri'
+    bullet.font.size = _pt(11)
+    bullet.paragraph_format.left_indent = _cm(0.75)
+
+    code = styles.add_style('SeeCode', WD_STYLE_TYPE.PARAGRAPH)
+    code.base_style = styles['Normal']
+    code.font.name = 'Consolas'
+    code.font.size = _pt(9)
+    code.font.color.rgb = _rgb(0x1A, 0x1A, 0x1A)
+    code.paragraph_format.space_after = _pt(0)
+
+    table_body = styles.add_style('SeeTableBody', WD_STYLE_TYPE.PARAGRAPH)
+    table_body.base_style = styles['Normal']
+    table_body.font.name = 'Calibri'
+    table_body.font.size = _pt(9.5)
+
+
+def add_heading(doc, text, level):
+    return doc.add_heading(text, level=level)
+
+
+def add_para(doc, text):
+    return doc.add_paragraph(text, style='SeeBody')
+
+
+def add_bullet(doc, text):
+    return doc.add_paragraph(text, style='SeeBullet')
+
+
+def add_bullets(doc, texts):
+    for text in texts:
+        doc.add_paragraph(text, style='SeeBullet')
+
+
+def add_code(doc, text):
+    """Render a code block as shaded monospace paragraphs, one per line."""
+    for line in text.splitlines() or ['']:
+        p = doc.add_paragraph(style='SeeCode')
+        run = p.add_run(line)
+        run._element.get_or_add_rPr().append(deepcopy(_SHD_TEMPLATE))
+
+
+def add_image(doc, payload):
+    filename, width_cm = payload
+    if filename not in _image_futures:
+        add_para(doc, f'[diagram not rendered: {filename}]')
+        return
+    p = doc.add_paragraph()
+    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    _pending_images.append((p, filename, width_cm))
+
+
+def _embed_images():
+    """Patch the prefetched diagrams into their placeholder paragraphs.
+
+    The emit loop only drops an empty centered paragraph per diagram, so
+    the PNG reads on _EXECUTOR overlap the CPU-bound XML construction;
+    by the time the body is finished every buffer is in memory and the
+    embeds (PNG header parse + zip write) run back to back.
+    """
+    for p, filename, width_cm in _pending_images:
+        p.add_run().add_picture(
+            _image_futures[filename].result(), width=_cm(width_cm))
+    _pending_images.clear()
+
+
+# Header-row formatting injected wholesale; pPr/rPr must be the first
+# child of their parent element.
+_HEADER_PPR = '<w:pPr %s><w:pStyle w:val="SeeTableBody"/></w:pPr>' % nsdecls('w')
+_HEADER_RPR = '<w:rPr %s><w:b/></w:rPr>' % nsdecls('w')
+
+
+def _tc_xml(text):
+    return (
+        '<w:tc><w:p><w:pPr><w:pStyle w:val="SeeTableBody"/></w:pPr>'
+        '<w:r><w:t xml:space="preserve">%s</w:t></w:r></w:p></w:tc>'
+        % escape(text)
+    )
+
+
+def add_table(doc, payload):
+    headers, rows = payload
+    table = doc.add_table(rows=1, cols=len(headers))
+    table.style = 'Light Grid Accent 1'
+    for col, header in enumerate(headers):
+        table.cell(0, col).text = header
+    # One XPath pass over the header row replaces the nested
+    # cell/paragraph/run Python loops; inserting ready-made pPr/rPr
+    # elements avoids python-docx's get-or-create property setters.
+    tr1 = table._tbl.xpath('./w:tr[1]')[0]
+    for p_el in tr1.xpath('.//w:p'):
+        p_el.insert(0, parse_xml(_HEADER_PPR))
+    for r_el in tr1.xpath('.//w:r'):
+        r_el.insert(0, parse_xml(_HEADER_RPR))
+    # Body rows: compose each w:tr as a single XML subtree. cell.text plus
+    # a per-cell paragraph/run walk re-traverses the OOXML tree twice per
+    # cell; parsing the ready-made row is one pass for the whole table.
+    tbl = table._tbl
+    for row in rows:
+        tbl.append(parse_xml(
+            '<w:tr %s>%s</w:tr>'
+            % (nsdecls('w'), ''.join(_tc_xml(val) for val in row))))
+    doc.add_paragraph()
+
+
+def render_latency_diagram():
+    """Render the depth-pipeline latency chart into IMG_DIR (best effort)."""
+    try:
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+    except ImportError:
+        return None
+    stages = ['YUV420 -> RGB', 'Resize + NCHW', 'ONNX inference', 'Post-process']
+    millis = [38, 21, 210, 6]
+    fig, ax = plt.subplots(figsize=(6, 2.5))
+    ax.barh(stages, millis, color='#1F3B73')
+    ax.invert_yaxis()
+    ax.set_xlabel('ms per frame (Pixel 6, vits @ 252x252)')
+    fig.tight_layout()
+    os.makedirs(IMG_DIR, exist_ok=True)
+    out = os.path.join(IMG_DIR, 'depth_latency.png')
+    fig.savefig(out, dpi=150)
+    plt.close(fig)
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Report content — single flat spec, rendered in one pass
+# ---------------------------------------------------------------------------
+
+# Shared labels: one interned string per repeated phrase, so identical
+# runs compress back-to-back in the zipped OOXML instead of duplicating.
+_SETTINGS = 'Open Settings'
+
+DART_PREPROCESS_REFERENCE = '''\
+// lib/services/depth_estimation_service.dart
+// Preprocess camera RGB into the float32 NCHW tensor the model expects.
+final inputData = Float32List(1 * 3 * inputSize * inputSize);
+for (int c = 0; c < 3; c++) {
+  for (int y = 0; y < inputSize; y++) {
+    for (int x = 0; x < inputSize; x++) {
+      final srcX = (x * width / inputSize).round().clamp(0, width - 1);
+      final srcY = (y * height / inputSize).round().clamp(0, height - 1);
+      final pixelIndex = (srcY * width + srcX) * 3;
+      final outputIndex = (c * inputSize * inputSize) + (y * inputSize) + x;
+      inputData[outputIndex] = rgbBytes[pixelIndex + c] / 255.0;
+    }
+  }
+}'''
+
+NUMPY_PREPROCESS_REFERENCE = '''\
+# scripts/preprocess_reference.py
+# Vectorized mirror of the Dart loop, used for calibration data.
+src_x = np.clip(np.rint(np.arange(size) * (width / size)).astype(np.intp),
+                0, width - 1)
+src_y = np.clip(np.rint(np.arange(size) * (height / size)).astype(np.intp),
+                0, height - 1)
+resized = rgb[np.ix_(src_y, src_x)]                   # (size, size, 3)
+chw = resized.transpose(2, 0, 1).astype(np.float32) / np.float32(255.0)
+return chw[np.newaxis, ...]                           # (1, 3, size, size)'''
+
+CONTENT = (
+    ('h1', 'Project S.E.E. — Smart Eye Enhancement'),
+    ('p', 'Technical Report — generated ' + GENERATED_PLACEHOLDER),
+    ('p', 'Project S.E.E. is an AI-powered visual assistant that empowers '
+          'visually impaired users through real-time object detection, '
+          'intelligent navigation, and multimodal AI interaction.'),
+
+    ('h2', '1. System Architecture'),
+    ('p', 'The app is a Flutter client backed by Firebase (auth, Firestore '
+          'telemetry) and Google Gemini (chat, live multimodal streaming). '
+          'All perception models run on-device so core assistance works '
+          'without connectivity.'),
+    ('img', ('architecture.png', 15.0)),
+
+    ('h2', '2. Core Services'),
+    ('table', (
+        ('Service', 'Responsibility'),
+        (
+            ('GeminiService', 'Chat and image analysis via the Gemini API'),
+            ('AccessibleLiveConnector', 'Camera + mic streaming to Gemini Live'),
+            ('MlKitService', 'On-device object detection (ML Kit)'),
+            ('DepthEstimationService', 'Monocular depth via Depth Anything V2 (ONNX)'),
+            ('NavigationService', 'Turn-by-turn guidance with obstacle callouts'),
+            ('LocationAwarenessService', 'Geofenced context announcements'),
+            ('TtsService', 'Prioritized speech output'),
+            ('VibrationService', 'Haptic proximity feedback'),
+        ),
+    )),
+
+    ('h2', '3. Depth Estimation Pipeline'),
+    ('p', 'Each camera frame is converted from YUV420 to RGB, resized to '
+          '252x252 (a multiple of the ViT patch size 14), normalized to '
+          '[0, 1] and laid out as a float32 NCHW tensor before being fed to '
+          'the Depth Anything V2 ONNX session:'),
+    ('code', DART_PREPROCESS_REFERENCE),
+    ('p', 'The conversion tooling mirrors this layout in NumPy '
+          '(scripts/preprocess_reference.py) to generate calibration data '
+          'for quantized exports — one gather pass instead of a scalar loop '
+          'per pixel. Recorded YUV420 camera dumps are unpacked with the '
+          'vectorized kernels in scripts/yuv_tools.py:'),
+    ('code', NUMPY_PREPROCESS_REFERENCE),
+    ('p', 'Inference is throttled to 3 FPS and results are cached between '
+          'frames. A per-object history of depth samples drives the '
+          'approaching / moving-away trend detection used for danger '
+          'warnings.'),
+    ('img', ('depth_latency.png', 14.0)),
+
+    ('h2', '4. On-Device Models'),
+    ('table', (
+        ('Model', 'Format', 'Input', 'Role'),
+        (
+            ('Depth Anything V2 (vits)', 'ONNX, opset 17', '1x3x252x252 float32',
+             'Monocular depth estimation'),
+            ('ML Kit Object Detection', 'Bundled', 'Camera stream',
+             'Object labels + bounding boxes'),
+        ),
+    )),
+
+    ('h2', '5. Accessibility Features'),
+    ('bullets', (
+        'Voice-first interaction: every screen is operable by speech.',
+        'Haptic proximity feedback scaled by obstacle distance.',
+        f'High-contrast theme and adjustable text scale via {_SETTINGS}.',
+        'TTS announcements with interrupt priority for danger warnings.',
+        f'Bilingual UI (English / Chinese) switchable from {_SETTINGS}.',
+    )),
+
+    ('h2', '6. Performance Notes'),
+    ('bullets', (
+        'Depth inference dominates the frame budget; it runs at most '
+        'every 333 ms with cached results in between.',
+        'Camera frames are processed on the main isolate; the YUV '
+        'conversion loop is the main candidate for native offload.',
+        'Gemini Live audio uses 16 kHz PCM to minimize uplink bandwidth.',
+    )),
+
+    ('h2', '7. Build & Release'),
+    ('p', 'Android is the primary target. Release builds use the standard '
+          'Flutter toolchain; model assets ship in assets/models/ and are '
+          'loaded from the app bundle at startup.'),
+)
+
+RENDERERS = {
+    'h1': lambda doc, payload: add_heading(doc, payload, 1),
+    'h2': lambda doc, payload: add_heading(doc, payload, 2),
+    'p': add_para,
+    'bullet': add_bullet,
+    'bullets': add_bullets,
+    'code': add_code,
+    'img': add_image,
+    'table': add_table,
+}
+
+
+# Bump whenever the render helpers, styles or latency-chart data change:
+# the frozen template bakes their output in, so the cache key has to
+# cover them, not just the content spec.
+_RENDER_VERSION = 2
+
+
+def _diagram_state():
+    """(name, mtime, size) of the source diagrams the template embeds.
+
+    depth_latency.png is excluded: it is regenerated from the hard-coded
+    chart data during the template build (so its mtime changes as a
+    side effect of building), and that data is covered by
+    _RENDER_VERSION instead.
+    """
+    try:
+        return tuple(sorted(
+            (e.name, e.stat().st_mtime_ns, e.stat().st_size)
+            for e in os.scandir(IMG_DIR)
+            if e.is_file() and e.name != 'depth_latency.png'))
+    except FileNotFoundError:
+        return ()
+
+
+def _template_path():
+    key = repr((_RENDER_VERSION, _diagram_state(), CONTENT))
+    spec_hash = hashlib.sha1(key.encode('utf-8')).hexdigest()[:12]
+    return os.path.join(CACHE_DIR, f'report_template_{spec_hash}.docx')
+
+
+def _build_template(template_path):
+    """Render the full static document once and freeze it in CACHE_DIR."""
+    render_latency_diagram()
+    _prefetch_images(CONTENT)
+    doc = Document()
+    _define_styles(doc)
+    for kind, payload in CONTENT:
+        RENDERERS[kind](doc, payload)
+    _embed_images()
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    doc.save(template_path)
+    return doc
+
+
+def build(output_path):
+    # The report is static apart from the generation date, so the heavy
+    # render (styles, tables, embedded diagrams) is frozen into a cached
+    # template keyed by the content spec. Repeat runs just reload it and
+    # patch the dynamic placeholders.
+    # --no-cache forces a fresh render for anything the key cannot see.
+    template_path = _template_path()
+    if os.path.exists(template_path) and '--no-cache' not in sys.argv:
+        doc = Document(template_path)
+    else:
+        doc = _build_template(template_path)
+
+    for p in doc.paragraphs:
+        if GENERATED_PLACEHOLDER in p.text:
+            p.text = p.text.replace(
+                GENERATED_PLACEHOLDER, date.today().isoformat())
+            break
+
+    doc.save(output_path)
+    print(f'Report written to {output_path}')
+
+
+if __name__ == '__main__':
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    build(args[0] if args else DEFAULT_OUTPUT)
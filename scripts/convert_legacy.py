@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""Convert a Depth Anything V2 checkpoint to the ONNX model the app ships.
+
+Produces assets/models/depth_anything_v2.onnx (float) plus an INT8
+dynamically-quantized variant for size-sensitive builds.
+
+Usage:
+    python scripts/convert_legacy.py [vits|vitb|vitl]
+
+Download the checkpoint first (manual step, HuggingFace):
+    depth_anything_v2_vits.pth -> scripts/checkpoints/
+"""
+
+import os
+import sys
+
+import numpy as np
+import torch
+
+from _load_dav2 import MODEL_CONFIGS, checkpoint_path, get_model
+from _repo_utils import dummy_input
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+OUTPUT_PATH = os.path.join(
+    SCRIPT_DIR, '..', 'assets', 'models', 'depth_anything_v2.onnx')
+
+# Must match DepthEstimationService: multiple of the ViT patch size 14.
+INPUT_SIZE = 252
+OPSET = 17
+
+
+def export_onnx(model, output_path):
+    # NHWC-strided weights/activations let the tracer see the layout the
+    # mobile conv kernels actually want, so the exported graph carries
+    # fewer transposes for ORT to fuse away. .contiguous() on the dummy
+    # copies rather than mutating the cached tensor validate() reuses.
+    model = model.to(memory_format=torch.channels_last)
+    dummy = dummy_input(INPUT_SIZE).contiguous(
+        memory_format=torch.channels_last)
+    # inference_mode is stronger than no_grad: the tracer sees tensors
+    # without autograd version counters, so no grad bookkeeping leaks
+    # into the graph. Spatial dims stay pinned at the deployed 252x252
+    # so constant folding specializes the resize/patch ops; only the
+    # batch dim is symbolic, letting ORT's memory-pattern planner reuse
+    # buffers across batched runs on dev machines.
+    with torch.inference_mode():
+        # Trace explicitly and hand the ScriptModule to export: the
+        # frozen trace drops the detach/clone ops the implicit tracer
+        # would otherwise emit, and surfaces control-flow surprises here
+        # rather than inside torch.onnx.
+        traced = torch.jit.trace(model, dummy, strict=False)
+        torch.onnx.export(
+            traced,
+            dummy,
+            output_path,
+            opset_version=OPSET,
+            do_constant_folding=True,
+            input_names=['input'],
+            output_names=['depth'],
+            dynamic_axes={'input': {0: 'batch'}, 'depth': {0: 'batch'}},
+        )
+    print(f'✅ Exported {output_path}')
+
+
+def export_static_bs1(output_path):
+    """Emit a sibling with the batch dim pinned back to 1.
+
+    The app only ever runs single frames; a fully static graph lets ORT
+    mobile pre-plan every allocation at session-create time.
+    """
+    try:
+        import onnx
+        from onnxruntime.tools.onnx_model_utils import make_dim_param_fixed
+    except ImportError:
+        print('⚠️ onnxruntime.tools unavailable, skipping bs1 artifact')
+        return None
+    model = onnx.load(output_path)
+    make_dim_param_fixed(model.graph, 'batch', 1)
+    bs1_path = output_path.replace('.onnx', '_bs1.onnx')
+    onnx.save(model, bs1_path)
+    print(f'✅ Static batch-1 model: {bs1_path}')
+    return bs1_path
+
+
+def optimize_graph(output_path):
+    """Simplify and fuse the raw torch trace before shipping.
+
+    The vanilla export leaves LayerNorm decomposed into Reduce/Sub/Mul/
+    Div chains and misses constant subgraphs that do_constant_folding
+    cannot see. onnxsim folds shapes and constants; the ORT transformer
+    optimizer then fuses LayerNorm/GELU/Attention into single kernels —
+    same FLOPs, far fewer kernel launches and intermediate buffers on
+    mobile ORT.
+    """
+    import onnx
+    try:
+        import onnxsim
+    except ImportError:
+        print('⚠️ onnxsim not available, skipping simplification')
+    else:
+        simplified, ok = onnxsim.simplify(onnx.load(output_path))
+        if ok:
+            onnx.save(simplified, output_path)
+            print('✅ onnxsim simplification applied')
+        else:
+            print('⚠️ onnxsim could not validate the simplified graph')
+
+    try:
+        from onnxruntime.transformers import optimizer
+    except ImportError:
+        print('⚠️ ORT transformer optimizer unavailable, skipping fusion')
+        return
+    fused = optimizer.optimize_model(output_path, model_type='vit')
+    fused.save_model_to_file(output_path)
+    print('✅ ORT transformer fusions applied')
+
+
+def convert_fp16(output_path):
+    """Rewrite the shipped model with FP16 weights, keeping float32 I/O.
+
+    ViT inference on mobile ORT is bandwidth-bound on patch-embed and
+    MatMul weights, so halving the weight bytes roughly doubles the
+    effective memory throughput — and halves the .onnx the app bundles.
+    LayerNorm stays FP32 via op_block_list; its reductions are the one
+    dynamic-range-sensitive spot in Depth Anything. The Dart side is
+    untouched because the graph I/O stays float32.
+    """
+    try:
+        import onnx
+        from onnxconverter_common import float16
+    except ImportError:
+        print('⚠️ onnxconverter-common not available, keeping FP32 weights')
+        return None
+    model = float16.convert_float_to_float16(
+        onnx.load(output_path), keep_io_types=True,
+        op_block_list=['LayerNormalization'])
+    onnx.save(model, output_path)
+    print(f'✅ FP16 weights written in place: {output_path}')
+    return output_path
+
+
+def save_external_data(output_path):
+    """Split the raw tensor bytes out of the ONNX protobuf.
+
+    Opt-in via --external-data. The weights land in one sibling .data
+    file that ORT mmaps at session creation instead of parsing through
+    protobuf — and for vitl it dodges protobuf's 2 GB serialization
+    ceiling outright. Tensors under 1 KB stay inline so the graph proto
+    keeps its shape constants.
+    """
+    import onnx
+
+    model = onnx.load(output_path)
+    onnx.save_model(
+        model, output_path,
+        save_as_external_data=True,
+        all_tensors_to_one_file=True,
+        location=os.path.basename(output_path) + '.data',
+        size_threshold=1024,
+        convert_attribute=False)
+    print(f'✅ Weights externalized to {output_path}.data')
+
+
+def quantize_int8(output_path):
+    """Emit an INT8 statically-quantized sibling next to the shipped model.
+
+    Static per-tensor QDQ quantization fixes activation ranges up front,
+    so ORT runs the ViT MatMuls on its INT8 MLAS kernels (ARM dotprod /
+    VNNI) with no runtime range computation — measurably faster than
+    FP32 and a quarter of the weight bytes. Activations are calibrated
+    on frames pushed through the app's exact preprocessing. Falls back
+    to dynamic (weight-only) quantization if calibration fails.
+    """
+    try:
+        from onnxruntime.quantization import (
+            CalibrationDataReader, QuantType, quantize_dynamic,
+            quantize_static)
+    except ImportError:
+        print('⚠️ onnxruntime.quantization not available, skipping INT8 export')
+        return None
+
+    from preprocess_reference import calibration_batches
+
+    int8_path = output_path.replace('.onnx', '_int8.onnx')
+
+    class _FrameReader(CalibrationDataReader):
+        """Feeds app-preprocessed synthetic frames to the calibrator."""
+
+        def __init__(self, count=32):
+            rng = np.random.default_rng(0)
+            frames = (
+                rng.integers(0, 256, size=(480, 640, 3), dtype=np.uint8)
+                for _ in range(count))
+            self._batches = ({'input': b}
+                             for b in calibration_batches(frames))
+
+        def get_next(self):
+            return next(self._batches, None)
+
+    try:
+        quantize_static(output_path, int8_path, _FrameReader())
+    except Exception as exc:
+        print(f'⚠️ Static quantization failed ({exc}); using dynamic')
+        quantize_dynamic(output_path, int8_path, weight_type=QuantType.QInt8)
+    print(f'✅ Quantized INT8 model: {int8_path}')
+    return int8_path
+
+
+def build_trt_engine(onnx_path):
+    """Pre-build a TensorRT engine plan from the exported ONNX.
+
+    Opt-in via --tensorrt, for the Jetson/desktop harness that replays
+    recorded walks against the model. Baking the engine once with
+    trtexec (FP16, shapes pinned to the app's single 252x252 frame)
+    removes the multi-minute builder pass ORT's TensorRT EP would
+    otherwise pay on every cold start.
+    """
+    import shutil
+    import subprocess
+
+    if shutil.which('trtexec') is None:
+        print('⚠️ trtexec not on PATH, skipping TensorRT engine build')
+        return None
+
+    plan_path = onnx_path.replace('.onnx', '.plan')
+    shape = f'input:1x3x{INPUT_SIZE}x{INPUT_SIZE}'
+    result = subprocess.run(
+        ['trtexec', f'--onnx={onnx_path}', f'--saveEngine={plan_path}',
+         '--fp16', f'--optShapes={shape}'])
+    if result.returncode != 0:
+        print('⚠️ trtexec failed, no engine written')
+        return None
+    print(f'✅ TensorRT engine: {plan_path}')
+    return plan_path
+
+
+def export_executorch(model, output_path):
+    """Emit an ExecuTorch .pte sibling for the on-device torch runtime.
+
+    Opt-in via --executorch. The XNNPACK partitioner delegates the ViT
+    MatMuls to the same SIMD kernels TFLite uses, and torchao int8
+    weight-only quantization quarters the flatbuffer before lowering —
+    a candidate replacement for the ORT path without touching ONNX at
+    all.
+    """
+    try:
+        import torch.export
+        from executorch import exir
+        from executorch.backends.xnnpack.partition.xnnpack_partitioner \
+            import XnnpackPartitioner
+        from torchao.quantization import int8_weight_only, quantize_
+    except ImportError:
+        print('⚠️ executorch/torchao not installed, skipping .pte export')
+        return None
+
+    quantize_(model, int8_weight_only())
+    dummy = dummy_input(INPUT_SIZE)
+    with torch.inference_mode():
+        exported = torch.export.export(model, (dummy,))
+    edge = exir.to_edge(exported).to_backend(XnnpackPartitioner())
+    pte_path = output_path.replace('.onnx', '.pte')
+    with open(pte_path, 'wb') as f:
+        edge.to_executorch().write_to_file(f)
+    print(f'✅ ExecuTorch model: {pte_path}')
+    return pte_path
+
+
+def convert_to_ort_format(output_path):
+    """Emit the .ort flatbuffer ORT Mobile loads fastest.
+
+    The .onnx stays the shipped asset (the Dart plugin reads it), but
+    the .ort sibling skips protobuf parsing and in-session graph
+    optimization at load — with optimization_style Fixed the graph is
+    pre-optimized to exactly what the mobile runtime executes, which is
+    most of the session-create latency on the phone.
+    """
+    import subprocess
+
+    result = subprocess.run(
+        [sys.executable, '-m',
+         'onnxruntime.tools.convert_onnx_models_to_ort', output_path,
+         '--optimization_style', 'Fixed',
+         '--output_dir', os.path.dirname(output_path)])
+    if result.returncode != 0:
+        print('⚠️ ORT-format conversion failed, .onnx remains usable')
+        return None
+    ort_path = output_path.replace('.onnx', '.ort')
+    print(f'✅ ORT-format model: {ort_path}')
+    return ort_path
+
+
+def validate(output_path):
+    import onnx
+    import onnxruntime as ort
+
+    proto = onnx.load(output_path)
+    onnx.checker.check_model(proto)
+
+    # Validation runs on the dev machine, not the phone: use every core
+    # and whatever accelerator provider (CUDA/CoreML/DirectML) is around
+    # instead of the single-threaded CPU defaults.
+    opts = ort.SessionOptions()
+    opts.intra_op_num_threads = os.cpu_count()
+    opts.graph_optimization_level = \
+        ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    session = ort.InferenceSession(
+        output_path, sess_options=opts,
+        providers=ort.get_available_providers())
+    test_input = dummy_input(INPUT_SIZE).numpy()
+    outputs = session.run(None, {'input': test_input})
+    print(f'✅ Validation OK, output shape: {outputs[0].shape}')
+
+    size_mb = os.stat(output_path).st_size / 1024 / 1024
+    print(f'   Model size: {size_mb:.1f} MB')
+
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    variant = args[0] if args else 'vits'
+    if variant not in MODEL_CONFIGS:
+        print(f'Unknown variant {variant!r}; pick one of '
+              f'{sorted(MODEL_CONFIGS)}')
+        return 1
+
+    # Fail on the missing checkpoint before ensure_repo() spends time
+    # fetching the upstream sources — the usual first-run mistake. One
+    # stat call instead of an exists probe that loading repeats anyway.
+    pth_file = checkpoint_path(variant)
+    try:
+        os.stat(pth_file)
+    except FileNotFoundError:
+        print(f'❌ Checkpoint not found: {pth_file}')
+        print(f'   Download depth_anything_v2_{variant}.pth from '
+              'HuggingFace into scripts/checkpoints/ first.')
+        return 1
+
+    model = get_model(variant)
+
+    os.makedirs(os.path.dirname(OUTPUT_PATH), exist_ok=True)
+    if '--executorch' in sys.argv:
+        # Quantizes the module in place, so run it on a dedicated pass
+        # rather than feeding the mutated model into the ONNX export.
+        export_executorch(model, OUTPUT_PATH)
+        return 0
+    export_onnx(model, OUTPUT_PATH)
+    optimize_graph(OUTPUT_PATH)
+    export_static_bs1(OUTPUT_PATH)
+    # Quantize off the FP32 export before the in-place FP16 rewrite.
+    quantize_int8(OUTPUT_PATH)
+    if '--keep-fp32' not in sys.argv:
+        convert_fp16(OUTPUT_PATH)
+    if '--external-data' in sys.argv:
+        save_external_data(OUTPUT_PATH)
+    if '--tensorrt' in sys.argv:
+        build_trt_engine(OUTPUT_PATH)
+    validate(OUTPUT_PATH)
+    convert_to_ort_format(OUTPUT_PATH)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Convert a Depth Anything V2 checkpoint straight to an INT8 TFLite model.
+
+ai_edge_torch lowers the torch module directly to a TFLite flatbuffer —
+no ONNX intermediate, no onnx-tf SavedModel round-trip on disk, and
+native TFLite builtins instead of Flex (SELECT_TF_OPS) ops. Quantization
+is calibrated on frames preprocessed exactly like the app does (see
+preprocess_reference.py).
+
+Usage:
+    python scripts/convert_midas_to_tflite.py [vits|vitb|vitl]
+
+Requires:
+    pip install ai-edge-torch
+"""
+
+import os
+import sys
+from itertools import islice
+
+import numpy as np
+import torch
+
+from _load_dav2 import MODEL_CONFIGS, checkpoint_path, get_model
+from _repo_utils import dummy_input
+from preprocess_reference import INPUT_SIZE, calibration_batches
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+TFLITE_PATH = os.path.join(
+    SCRIPT_DIR, '..', 'assets', 'models', 'depth_anything_v2_int8.tflite')
+
+# Forward passes during PT2E calibration are expensive; this many frames
+# is plenty for per-channel symmetric ranges.
+CALIBRATION_FRAMES = 20
+
+
+def _representative_frames(count=100):
+    """Synthetic camera frames pushed through the app's exact preprocessing.
+
+    Real captures are better; drop .npy RGB frames into
+    scripts/calibration_frames/ to use them instead.
+    """
+    frames_dir = os.path.join(SCRIPT_DIR, 'calibration_frames')
+    if os.path.isdir(frames_dir):
+        for name in sorted(os.listdir(frames_dir)):
+            if name.endswith('.npy'):
+                yield np.load(os.path.join(frames_dir, name))
+        return
+    rng = np.random.default_rng(0)
+    for _ in range(count):
+        yield rng.integers(
+            0, 256, size=(480, 640, 3), dtype=np.uint8)
+
+
+def convert_to_tflite(model):
+    """Lower the torch module to TFLite, INT8-quantized when possible."""
+    import ai_edge_torch
+
+    # TFLite is NHWC-native; handing the lowering a channels_last module
+    # and example input avoids layout-shuffle ops in the flatbuffer.
+    model = model.to(memory_format=torch.channels_last)
+    dummy = dummy_input(INPUT_SIZE).contiguous(
+        memory_format=torch.channels_last)
+    try:
+        from ai_edge_torch.quantize.pt2e_quantizer import (
+            PT2EQuantizer, get_symmetric_quantization_config)
+        from ai_edge_torch.quantize.quant_config import QuantConfig
+        from torch._export import capture_pre_autograd_graph
+        from torch.ao.quantization.quantize_pt2e import (
+            convert_pt2e, prepare_pt2e)
+    except ImportError:
+        print('⚠️ PT2E quantizer unavailable; exporting float32 TFLite')
+        edge_model = ai_edge_torch.convert(model, (dummy,))
+    else:
+        quantizer = PT2EQuantizer().set_global(
+            get_symmetric_quantization_config(is_per_channel=True))
+        captured = capture_pre_autograd_graph(model, (dummy,))
+        prepared = prepare_pt2e(captured, quantizer)
+        batches = calibration_batches(_representative_frames())
+        for batch in islice(batches, CALIBRATION_FRAMES):
+            prepared(torch.from_numpy(batch))
+        converted = convert_pt2e(prepared, fold_quantize=False)
+        edge_model = ai_edge_torch.convert(
+            converted, (dummy,),
+            quant_config=QuantConfig(pt2e_quantizer=quantizer))
+
+    edge_model.export(TFLITE_PATH)
+    size_mb = os.path.getsize(TFLITE_PATH) / 1024 / 1024
+    print(f'✅ TFLite model written: {TFLITE_PATH} ({size_mb:.1f} MB)')
+
+
+def main():
+    variant = sys.argv[1] if len(sys.argv) > 1 else 'vits'
+    if variant not in MODEL_CONFIGS:
+        print(f'Unknown variant {variant!r}; pick one of '
+              f'{sorted(MODEL_CONFIGS)}')
+        return 1
+
+    pth_file = checkpoint_path(variant)
+    try:
+        os.stat(pth_file)
+    except FileNotFoundError:
+        print(f'❌ Checkpoint not found: {pth_file}')
+        return 1
+
+    model = get_model(variant)
+
+    os.makedirs(os.path.dirname(TFLITE_PATH), exist_ok=True)
+    convert_to_tflite(model)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Convert the shipped ONNX depth model straight to TFLite with onnx2tf.
+
+onnx2tf emits native TFLite builtins directly from the ONNX graph — no
+onnx-tf prepare(), no multi-GB SavedModel round-trip on disk, and no Flex
+ops (SELECT_TF_OPS) dragging the Flex delegate into the app binary.
+
+Usage:
+    python scripts/convert_onnx_to_tflite.py [model.onnx]
+
+Requires:
+    pip install onnx2tf onnx tensorflow
+"""
+
+import os
+import shutil
+import sys
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_ONNX = os.path.join(
+    SCRIPT_DIR, '..', 'assets', 'models', 'depth_anything_v2.onnx')
+OUTPUT_DIR = os.path.join(SCRIPT_DIR, 'tflite_out')
+TFLITE_PATH = os.path.join(
+    SCRIPT_DIR, '..', 'assets', 'models', 'depth_anything_v2.tflite')
+
+
+def convert(onnx_path):
+    import onnx2tf
+
+    onnx2tf.convert(
+        input_onnx_file_path=onnx_path,
+        output_folder_path=OUTPUT_DIR,
+        copy_onnx_input_output_names_to_tflite=True,
+        non_verbose=True,
+    )
+
+    # onnx2tf names the artifact after the graph; pick the float32 one.
+    produced = [f for f in os.listdir(OUTPUT_DIR)
+                if f.endswith('_float32.tflite') or f.endswith('.tflite')]
+    if not produced:
+        print('❌ onnx2tf produced no .tflite artifact')
+        return 1
+    produced.sort(key=lambda f: not f.endswith('_float32.tflite'))
+    shutil.copyfile(os.path.join(OUTPUT_DIR, produced[0]), TFLITE_PATH)
+    size_mb = os.path.getsize(TFLITE_PATH) / 1024 / 1024
+    print(f'✅ TFLite model written: {TFLITE_PATH} ({size_mb:.1f} MB)')
+    return 0
+
+
+def main():
+    onnx_path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_ONNX
+    if not os.path.exists(onnx_path):
+        print(f'❌ ONNX model not found: {onnx_path}')
+        print('   Run scripts/convert_legacy.py first.')
+        return 1
+    return convert(onnx_path)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""Convert the project markdown docs to a printable HTML page.
+
+Renders README.md (or any markdown file) into a styled standalone HTML
+document that browsers print to PDF cleanly. Only the markdown subset the
+docs actually use is handled: headers, lists, tables, fenced code blocks,
+blockquotes, bold / italic / inline code / links. Mermaid diagram sources
+are dropped — they do not render in print.
+
+Usage:
+    python scripts/convert_to_pdf.py [input.md] [output.html]
+"""
+
+import html
+import os
+import re
+import sys
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_INPUT = os.path.join(SCRIPT_DIR, '..', 'README.md')
+
+# Inline patterns compiled once at module scope; calling .sub on the
+# compiled pattern skips the regex-cache lookup re.sub pays per call.
+_CODE = re.compile(r'`([^`]+)`')
+_BOLD = re.compile(r'\*\*(.+?)\*\*')
+_ITALIC = re.compile(r'(?<!\*)\*([^*]+)\*(?!\*)')
+_LINK = re.compile(r'\[([^\]]*)\]\(([^)]+)\)')
+_IMAGE = re.compile(r'!\[([^\]]*)\]\(([^)]+)\)')
+
+# One alternation classifies a line's block type in a single scan instead
+# of a startswith cascade per line. Checked against the stripped line.
+_BLOCK = re.compile(
+    r'(?P<fence>```(?P<lang>\w*)\s*$)'
+    r'|(?P<header>(?P<hashes>#{1,6})\s+(?P<htext>.*)$)'
+    r'|(?P<bullet>[-*]\s+(?P<btext>.*)$)'
+    r'|(?P<num>\d+\.\s+(?P<ntext>.*)$)'
+    r'|(?P<table>\|.*\|\s*$)'
+    r'|(?P<rule>-{3,}\s*$)'
+    r'|(?P<quote>>\s?(?P<qtext>.*)$)'
+)
+
+_BLOCK_KINDS = ('fence', 'header', 'bullet', 'num', 'table', 'rule', 'quote')
+
+# Container blocks whose closing tag is deferred until a line of another
+# kind arrives. Adding a new container (e.g. blockquotes) is one entry
+# in each dict instead of another boolean threaded through md_to_html.
+_OPENERS = {'list': '<ul>', 'olist': '<ol>', 'table': '<table>',
+            'quote': '<blockquote>'}
+_CLOSERS = {'list': '</ul>', 'olist': '</ol>', 'table': '</table>',
+            'quote': '</blockquote>'}
+
+# Which container each line kind is allowed to stay inside.
+_KEEPS = {'bullet': ('list',), 'num': ('olist',), 'table': ('table',),
+          'quote': ('quote',)}
+
+# Code-block lines only need the three markup-significant characters
+# escaped; str.translate with a precomputed table is one C-level pass,
+# versus html.escape's chained str.replace calls (which also touch
+# quotes that <pre> content never needs escaped).
+_CODE_TRANS = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+
+CSS = """\
+body { font-family: 'Segoe UI', Roboto, sans-serif; max-width: 52rem;
+       margin: 2rem auto; padding: 0 1rem; color: #1f2430; line-height: 1.55; }
+h1, h2, h3 { color: #1f3b73; }
+h1 { border-bottom: 2px solid #1f3b73; padding-bottom: .3rem; }
+code { background: #f1f5f9; padding: .1rem .3rem; border-radius: 3px;
+       font-family: Consolas, monospace; font-size: .92em; }
+pre { background: #f1f5f9; padding: .8rem; border-radius: 6px;
+      overflow-x: auto; }
+pre code { padding: 0; }
+table { border-collapse: collapse; margin: 1rem 0; }
+th, td { border: 1px solid #cbd5e1; padding: .35rem .6rem; text-align: left; }
+th { background: #e2e8f0; }
+blockquote { border-left: 3px solid #cbd5e1; margin: 1rem 0;
+             padding: .1rem 1rem; color: #475569; }
+blockquote p { margin: .4rem 0; }
+a { color: #1d4ed8; }
+hr { border: none; border-top: 1px solid #cbd5e1; margin: 1.5rem 0; }
+@media print { body { margin: 0 auto; } a { color: inherit; } }
+"""
+
+
+def _inline(text):
+    """Escape a text fragment and apply the inline markdown patterns."""
+    text = html.escape(text)
+    text = _IMAGE.sub(r'<img src="\2" alt="\1">', text)
+    text = _CODE.sub(r'<code>\1</code>', text)
+    text = _BOLD.sub(r'<strong>\1</strong>', text)
+    text = _ITALIC.sub(r'<em>\1</em>', text)
+    text = _LINK.sub(r'<a href="\2">\1</a>', text)
+    return text
+
+
+def _classify(match):
+    for kind in _BLOCK_KINDS:
+        if match.group(kind):
+            return kind
+    return None
+
+
+def _close_until(stack, keep=()):
+    """Pop open containers not in `keep`, yielding their closing tags."""
+    while stack and stack[-1] not in keep:
+        yield _CLOSERS[stack.pop()]
+
+
+def md_to_html(md_lines):
+    """Yield HTML body lines for an iterable of markdown lines.
+
+    Takes the open file object directly and yields as it goes, so neither
+    the source document nor the rendered HTML is ever fully materialized
+    in memory.
+    """
+    in_code = False
+    in_mermaid = False
+    # Opening <pre><code> tag held back and fused onto the first code
+    # line: main() newline-joins the yields, and browsers only swallow a
+    # newline directly after <pre>, so a standalone opener line would
+    # render every fenced block with a leading blank line.
+    code_open = ''
+    open_blocks = []
+
+    for line in md_lines:
+        line = line.rstrip('\n')
+        stripped = line.strip()
+
+        # Consume a fenced mermaid block wholesale: one flag toggle per
+        # fence, no per-line substring heuristics on the rest of the doc.
+        if in_mermaid:
+            if stripped.startswith('```'):
+                in_mermaid = False
+            continue
+
+        if in_code:
+            if stripped.startswith('```'):
+                yield code_open + '</code></pre>'
+                in_code = False
+            else:
+                yield code_open + line.translate(_CODE_TRANS)
+                code_open = ''
+            continue
+
+        match = _BLOCK.match(stripped)
+        kind = _classify(match) if match else None
+
+        yield from _close_until(open_blocks, _KEEPS.get(kind, ()))
+
+        if kind == 'fence':
+            if match.group('lang') == 'mermaid':
+                in_mermaid = True
+            else:
+                code_open = '<pre><code class="%s">' % match.group('lang')
+                in_code = True
+        elif kind == 'header':
+            level = len(match.group('hashes'))
+            yield ('<h%d>%s</h%d>'
+                   % (level, _inline(match.group('htext')), level))
+        elif kind == 'bullet' or kind == 'num':
+            container = 'list' if kind == 'bullet' else 'olist'
+            if not open_blocks:
+                if kind == 'num':
+                    # Honour the source ordinal: indented sub-bullets
+                    # between numbered steps close the <ol>, and a bare
+                    # reopen would restart the visible numbering at 1.
+                    start = int(match.group('num').split('.', 1)[0])
+                    yield ('<ol>' if start == 1
+                           else '<ol start="%d">' % start)
+                else:
+                    yield _OPENERS[container]
+                open_blocks.append(container)
+            text = match.group('btext') or match.group('ntext')
+            yield '<li>%s</li>' % _inline(text)
+        elif kind == 'table':
+            cells = [c.strip() for c in stripped.strip('|').split('|')]
+            if all(set(c) <= set('-: ') for c in cells):
+                continue  # header separator row
+            tag = 'td' if open_blocks else 'th'
+            if not open_blocks:
+                yield _OPENERS['table']
+                open_blocks.append('table')
+            yield ('<tr>%s</tr>' % ''.join(
+                '<%s>%s</%s>' % (tag, _inline(c), tag) for c in cells))
+        elif kind == 'quote':
+            if not open_blocks:
+                yield _OPENERS['quote']
+                open_blocks.append('quote')
+            yield '<p>%s</p>' % _inline(match.group('qtext'))
+        elif kind == 'rule':
+            yield '<hr>'
+        elif stripped.startswith('<'):
+            yield line  # raw HTML passes through
+        elif stripped:
+            yield '<p>%s</p>' % _inline(stripped)
+
+    if in_code:
+        yield code_open + '</code></pre>'
+    yield from _close_until(open_blocks)
+
+
+def main():
+    input_path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_INPUT
+    output_path = (sys.argv[2] if len(sys.argv) > 2
+                   else os.path.splitext(input_path)[0] + '.html')
+
+    title = html.escape(os.path.basename(input_path))
+    with open(input_path, encoding='utf-8') as src, \
+            open(output_path, 'w', encoding='utf-8') as dst:
+        dst.write(
+            '<!DOCTYPE html>\n<html lang="en">\n<head>\n'
+            '<meta charset="utf-8">\n'
+            f'<title>{title}</title>\n<style>\n{CSS}</style>\n'
+            '</head>\n<body>\n')
+        for html_line in md_to_html(src):
+            dst.write(html_line)
+            dst.write('\n')
+        dst.write('</body>\n</html>\n')
+    print(f'✅ HTML written: {output_path} (print to PDF from a browser)')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""NumPy reference for the app's depth-model preprocessing.
+
+Mirrors _preprocessImageFloat32 in lib/services/depth_estimation_service.dart:
+nearest-neighbour resize to INPUT_SIZE x INPUT_SIZE, scale to [0, 1], lay out
+as float32 NCHW. The model conversion scripts use it to generate calibration
+batches for quantized exports, so it must keep the Dart loop's sampling while
+running at NumPy speed instead of one Python op per pixel.
+"""
+
+import numpy as np
+
+INPUT_SIZE = 252  # must match DepthEstimationService.inputSize
+
+
+def rgb_to_nchw_float32(rgb, size=INPUT_SIZE):
+    """Convert an HxWx3 uint8 RGB frame to a (1, 3, size, size) float32 tensor.
+
+    Vectorized equivalent of the Dart triple loop: build the source index
+    vectors once with rint/clip (the Dart round + clamp), gather the resized
+    image in one fancy-indexing pass, then transpose to channel-first and
+    scale — no per-pixel Python bytecode.
+    """
+    rgb = np.asarray(rgb, dtype=np.uint8)
+    height, width = rgb.shape[:2]
+    src_x = np.clip(
+        np.rint(np.arange(size) * (width / size)).astype(np.intp), 0, width - 1)
+    src_y = np.clip(
+        np.rint(np.arange(size) * (height / size)).astype(np.intp), 0, height - 1)
+    resized = rgb[np.ix_(src_y, src_x)]  # (size, size, 3)
+    chw = resized.transpose(2, 0, 1).astype(np.float32) / np.float32(255.0)
+    return chw[np.newaxis, ...]
+
+
+def calibration_batches(frames, size=INPUT_SIZE):
+    """Yield model-ready (1, 3, size, size) tensors for quantization calibration."""
+    for frame in frames:
+        yield rgb_to_nchw_float32(frame, size)
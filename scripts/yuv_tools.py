@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Vectorized YUV camera-frame kernels for the conversion tooling.
+
+Python references for the Dart-side CameraImage handling in
+lib/services/depth_estimation_service.dart, used to turn recorded YUV420
+camera dumps into RGB calibration frames. NumPy slicing replaces the
+per-pixel Python loops with whole-plane copies/gathers; when numba is
+installed the RGB kernel is JIT-compiled and parallelized on top.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    _HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - numba is optional
+    _HAVE_NUMBA = False
+
+
+def _plane(data, height, width, row_stride, pixel_stride=1):
+    """View a raw plane buffer as a (height, width) array, stride-aware."""
+    data = np.frombuffer(data, dtype=np.uint8) \
+        if not isinstance(data, np.ndarray) else data.ravel()
+    needed = height * row_stride
+    if data.size < needed:
+        # Android plane buffers end at the last addressed byte,
+        # (height-1)*row_stride + (width-1)*pixel_stride + 1, not at a
+        # full final row. Pad the tail so the reshape works; the padding
+        # sits past the last sampled column and never reaches the output.
+        padded = np.zeros(needed, dtype=np.uint8)
+        padded[:data.size] = data
+        data = padded
+    rows = data[:needed].reshape(height, row_stride)
+    return rows[:, :width * pixel_stride:pixel_stride]
+
+
+def yuv420_to_nv21(y, u, v, width, height,
+                   y_stride=None, uv_stride=None, uv_pixel_stride=1):
+    """Pack planar YUV420 into NV21 (full Y plane, then interleaved V/U).
+
+    One contiguous Y copy plus two strided gathers for the chroma planes —
+    no per-pixel loop.
+    """
+    y_stride = y_stride or width
+    uv_stride = uv_stride or width // 2
+    half_w, half_h = width // 2, height // 2
+
+    out = np.empty(width * height + 2 * half_w * half_h, dtype=np.uint8)
+    out[:width * height] = _plane(y, height, width, y_stride).ravel()
+    vu = out[width * height:].reshape(-1, 2)
+    vu[:, 0] = _plane(v, half_h, half_w, uv_stride, uv_pixel_stride).ravel()
+    vu[:, 1] = _plane(u, half_h, half_w, uv_stride, uv_pixel_stride).ravel()
+    return out
+
+
+def _yuv_to_rgb_numpy(y, u, v):
+    """BT.601 YUV->RGB on full-size planes (float32 intermediate)."""
+    yf = y.astype(np.float32)
+    uf = u.astype(np.float32) - 128.0
+    vf = v.astype(np.float32) - 128.0
+    rgb = np.empty(y.shape + (3,), dtype=np.float32)
+    rgb[..., 0] = yf + 1.402 * vf
+    rgb[..., 1] = yf - 0.344 * uf - 0.714 * vf
+    rgb[..., 2] = yf + 1.772 * uf
+    return np.clip(np.rint(rgb), 0, 255).astype(np.uint8)
+
+
+if _HAVE_NUMBA:
+    @njit(parallel=True, cache=True)
+    def _yuv_to_rgb_numba(y, u, v):  # pragma: no cover - needs numba
+        height, width = y.shape
+        rgb = np.empty((height, width, 3), dtype=np.uint8)
+        for row in prange(height):
+            for col in range(width):
+                yv = y[row, col]
+                uv = u[row, col] - 128.0
+                vv = v[row, col] - 128.0
+                r = yv + 1.402 * vv
+                g = yv - 0.344 * uv - 0.714 * vv
+                b = yv + 1.772 * uv
+                rgb[row, col, 0] = min(max(round(r), 0), 255)
+                rgb[row, col, 1] = min(max(round(g), 0), 255)
+                rgb[row, col, 2] = min(max(round(b), 0), 255)
+        return rgb
+
+
+def yuv420_to_rgb(y, u, v, width, height,
+                  y_stride=None, uv_stride=None, uv_pixel_stride=1):
+    """Convert planar YUV420 to an HxWx3 uint8 RGB frame.
+
+    Matches the Dart _convertCameraImageToRgb coefficients. The chroma
+    planes are upsampled to full resolution with np.repeat, then the
+    colour transform runs as three fused array expressions (or the numba
+    kernel when available) instead of width*height Python iterations.
+    """
+    y_stride = y_stride or width
+    uv_stride = uv_stride or width // 2
+    half_w, half_h = width // 2, height // 2
+
+    y_full = _plane(y, height, width, y_stride)
+    u_full = np.repeat(np.repeat(
+        _plane(u, half_h, half_w, uv_stride, uv_pixel_stride), 2, axis=0),
+        2, axis=1)[:height, :width]
+    v_full = np.repeat(np.repeat(
+        _plane(v, half_h, half_w, uv_stride, uv_pixel_stride), 2, axis=0),
+        2, axis=1)[:height, :width]
+
+    if _HAVE_NUMBA:
+        return _yuv_to_rgb_numba(
+            np.ascontiguousarray(y_full).astype(np.float32),
+            np.ascontiguousarray(u_full).astype(np.float32),
+            np.ascontiguousarray(v_full).astype(np.float32))
+    return _yuv_to_rgb_numpy(y_full, u_full, v_full)